@@ -1,4 +1,5 @@
-from typing import Dict, Any, List, Tuple, Final, Optional, cast
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Tuple, Final, Optional
 
 from algosdk.error import SourceMapVersionError
 
@@ -22,25 +23,12 @@ class SourceMap:
 
         self.mappings: str = source_map["mappings"]
 
-        pc_list = [
-            _decode_int_value(raw_val) for raw_val in self.mappings.split(";")
-        ]
+        pc_lines = _parse_mappings(self.mappings)
 
-        self.pc_to_line: Dict[int, int] = {}
+        self.pc_to_line: Dict[int, int] = dict(enumerate(pc_lines))
         self.line_to_pc: Dict[int, List[int]] = {}
-
-        last_line = 0
-        for index, line_delta in enumerate(pc_list):
-            # line_delta is None if the line number has not changed
-            # or if the line is empty
-            if line_delta is not None:
-                last_line = last_line + line_delta
-
-            if last_line not in self.line_to_pc:
-                self.line_to_pc[last_line] = []
-
-            self.line_to_pc[last_line].append(index)
-            self.pc_to_line[index] = last_line
+        for pc, line in enumerate(pc_lines):
+            self.line_to_pc.setdefault(line, []).append(pc)
 
     def get_line_for_pc(self, pc: int) -> Optional[int]:
         return self.pc_to_line.get(pc, None)
@@ -49,11 +37,48 @@ class SourceMap:
         return self.line_to_pc.get(line, None)
 
 
-def _decode_int_value(value: str) -> Optional[int]:
-    # Mappings may have up to 5 segments:
-    # Third segment represents the zero-based starting line in the original source represented.
-    decoded_value = _base64vlq_decode(value)
-    return decoded_value[2] if decoded_value else None
+@lru_cache(maxsize=128)
+def _parse_mappings(mappings: str) -> Tuple[int, ...]:
+    # Returns the source line of every pc, indexed by pc, cached per mappings
+    # string so a SourceMap rebuilt from the same JSON skips decoding.
+    return tuple(_scan_mappings(mappings))
+
+
+def _scan_mappings(mappings: str) -> Iterator[int]:
+    # Yields the source line of every ";"-separated segment, decoding
+    # the line deltas and accumulating the line number in a single pass
+    # over the mappings. Only the first three fields of a segment are
+    # decoded, the remaining bytes up to the next separator are skipped.
+    # Segments without a line delta keep the previous line.
+    line = 0
+    field = shift = value = 0
+    translated = mappings.encode("ascii").translate(_mappings_table)
+    if _invalid in translated:
+        offset = translated.index(_invalid)
+        raise ValueError(
+            f"Invalid base64 VLQ character {mappings[offset]!r} "
+            f"at offset {offset} of mappings"
+        )
+    for v in translated:
+        if v == _separator:
+            yield line
+            field = shift = value = 0
+            continue
+        if field > 2:
+            continue
+        value += (v & mask) << shift
+        if v & flag:
+            shift += shiftsize
+            continue
+        if field == 2:
+            # the third field is the zero-based source line delta, its
+            # lowest bit is the sign which is applied without branching
+            # as two's complement: (x ^ -1) + 1 == -x
+            sign = value & 1
+            line += ((value >> 1) ^ -sign) + sign
+        field += 1
+        shift = value = 0
+    yield line
 
 
 """
@@ -61,25 +86,17 @@ Source taken from: https://gist.github.com/mjpieters/86b0d152bb51d5f5979346d1100
 """
 
 _b64chars = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
-_b64table: Final[List[Optional[int]]] = [None] * (max(_b64chars) + 1)
-for i, b in enumerate(_b64chars):
-    _b64table[b] = i
+# bytes.translate tables from base64 characters to their values, with
+# every other byte mapped to _invalid
+_invalid: Final[int] = 0xFF
+_b64table: Final[bytes] = bytes(
+    _b64chars.find(b) if b in _b64chars else _invalid for b in range(256)
+)
+# the mappings table additionally maps ";" to _separator, outside the
+# range of base64 values
+_separator: Final[int] = 1 << 6
+_mappings_table: Final[bytes] = (
+    _b64table[: ord(";")] + bytes([_separator]) + _b64table[ord(";") + 1 :]
+)
 
 shiftsize, flag, mask = 5, 1 << 5, (1 << 5) - 1
-
-
-def _base64vlq_decode(vlqval: str) -> Tuple[int, ...]:
-    """Decode Base64 VLQ value"""
-    results = []
-    shift = value = 0
-    # use byte values and a table to go from base64 characters to integers
-    for v in map(_b64table.__getitem__, vlqval.encode("ascii")):
-        v = cast(int, v)  # force int type given context
-        value += (v & mask) << shift
-        if v & flag:
-            shift += shiftsize
-            continue
-        # determine sign and add to results
-        results.append((value >> 1) * (-1 if value & 1 else 1))
-        shift = value = 0
-    return tuple(results)
@@ -10,6 +10,7 @@ from algosdk import (
     error,
     logic,
     mnemonic,
+    source_map,
     util,
     wordlist,
 )
@@ -594,3 +595,75 @@ class TestEncoding(unittest.TestCase):
             assert f"{bad_type} is not bytes, bytearray, str, or int" == str(
                 te.value
             )
+
+
+class TestSourceMap(unittest.TestCase):
+    def test_line_delta_decode(self):
+        vectors = {
+            "A": 0,
+            "B": 0,
+            "C": 1,
+            "D": -1,
+            "F": -2,
+            "gB": 16,
+            "hB": -16,
+            "2H": 123,
+            "3H": -123,
+        }
+        for vlqval, expected in vectors.items():
+            smap = source_map.SourceMap(
+                {"version": 3, "sources": [], "mappings": f"AA{vlqval}A"}
+            )
+            self.assertEqual(smap.pc_to_line, {0: expected})
+
+    def test_negative_line_deltas(self):
+        smap = source_map.SourceMap(
+            {
+                "version": 3,
+                "sources": [],
+                "mappings": "AAAA;AACA;AAEA;;AADA;AAFA",
+            }
+        )
+        self.assertEqual(smap.pc_to_line, {0: 0, 1: 1, 2: 3, 3: 3, 4: 2, 5: 0})
+        self.assertEqual(smap.get_pcs_for_line(0), [0, 5])
+        self.assertEqual(smap.get_pcs_for_line(3), [2, 3])
+        self.assertIsNone(smap.get_line_for_pc(6))
+
+    def test_parsed_mappings_cached(self):
+        jsmap = {"version": 3, "sources": [], "mappings": "AAAA;AACA;AACA"}
+        source_map._parse_mappings.cache_clear()
+        first = source_map.SourceMap(jsmap)
+        second = source_map.SourceMap(dict(jsmap))
+        self.assertEqual(source_map._parse_mappings.cache_info().hits, 1)
+
+        self.assertEqual(first.pc_to_line, second.pc_to_line)
+        self.assertEqual(first.line_to_pc, second.line_to_pc)
+        self.assertIsNot(first.pc_to_line, second.pc_to_line)
+        self.assertIsNot(first.line_to_pc, second.line_to_pc)
+        self.assertIsNot(first.line_to_pc[0], second.line_to_pc[0])
+
+        first.line_to_pc[0].append(99)
+        self.assertEqual(second.get_pcs_for_line(0), [0])
+
+    def test_invalid_mappings_character(self):
+        for mappings, char, offset in [
+            ("AA!A", "!", 2),
+            ("AACA,AACA", ",", 4),
+        ]:
+            with pytest.raises(ValueError) as ve:
+                source_map.SourceMap(
+                    {"version": 3, "sources": [], "mappings": mappings}
+                )
+            assert (
+                f"Invalid base64 VLQ character {char!r} at offset {offset}"
+                in str(ve.value)
+            )
+
+    def test_segments_without_line_field(self):
+        # segments with fewer than three fields carry no source line delta
+        # and keep the previous line
+        smap = source_map.SourceMap(
+            {"version": 3, "sources": [], "mappings": "AACA;A;AA;AACA"}
+        )
+        self.assertEqual(smap.pc_to_line, {0: 1, 1: 1, 2: 1, 3: 2})
+        self.assertEqual(smap.get_pcs_for_line(1), [0, 1, 2])